@@ -12,31 +12,58 @@ from pathlib import Path
 
 VERSION_FILE_PATTERNS = {
     "pyproject.toml": (
-        r'version\s*=\s*"([^"]+)"',
+        None,
         "pyproject.toml version"
     ),
     "CMakeLists.txt": (
-        r'project\([^)]+VERSION\s+(\d+\.\d+\.\d+)',
+        re.compile(r'project\([^)]+VERSION\s+(\d+\.\d+\.\d+)'),
         "CMakeLists.txt version (base only, no beta suffix)"
     ),
     "src/blackmagic_output/__init__.py": (
-        r'__version__\s*=\s*"([^"]+)"',
+        None,
         "__init__.py version"
     ),
     "src/python_bindings.cpp": (
-        r'm\.attr\("__version__"\)\s*=\s*"([^"]+)"',
+        re.compile(r'm\.attr\("__version__"\)\s*=\s*"([^"]+)"'),
         "python_bindings.cpp version"
     ),
 }
 
-CHANGELOG_PATTERN = r'##\s+\[([^\]]+)\]\s+-\s+\d{4}-\d{2}-\d{2}'
+# Files whose version sits on a simple `<prefix> = "X.Y.Z"` line. These are
+# read with plain string checks instead of a regex pattern.
+VERSION_LINE_PREFIXES = {
+    "pyproject.toml": "version",
+    "src/blackmagic_output/__init__.py": "__version__",
+}
+
+CHANGELOG_PATTERN = re.compile(r'##\s+\[([^\]]+)\]\s+-\s+\d{4}-\d{2}-\d{2}')
+
+BASE_VERSION_PATTERN = re.compile(r'(\d+\.\d+\.\d+)')
+
+
+def read_file(file_path):
+    """Read a whole file and decode it as UTF-8, independent of the locale."""
+    return Path(file_path).read_bytes().decode("utf-8")
+
+
+def extract_line_version(content, prefix):
+    """Extract a quoted version from the first `<prefix> = "..."` line, if any."""
+    for line in content.splitlines():
+        line = line.lstrip()
+        if line.startswith(prefix) and line[len(prefix):].lstrip().startswith("="):
+            parts = line.split('"')
+            if len(parts) >= 3:
+                return parts[1]
+    return None
 
 
-def extract_version(file_path, pattern):
-    """Extract version string from a file using regex pattern."""
+def extract_version(file_path, pattern, line_prefix=None):
+    """Extract version string from a file using a line prefix or a compiled regex pattern."""
     try:
-        content = Path(file_path).read_text()
-        match = re.search(pattern, content)
+        content = read_file(file_path)
+        if line_prefix is not None:
+            return extract_line_version(content, line_prefix)
+        match = pattern.search(content)
         if match:
             return match.group(1)
         return None
@@ -46,7 +73,7 @@ def extract_version(file_path, pattern):
 
 def extract_base_version(version_string):
     """Extract base version (X.Y.Z) from version string, removing beta suffixes."""
-    match = re.match(r'(\d+\.\d+\.\d+)', version_string)
+    match = BASE_VERSION_PATTERN.match(version_string)
     return match.group(1) if match else version_string
 
 
@@ -60,7 +87,7 @@ def check_versions():
 
     for file_path, (pattern, description) in VERSION_FILE_PATTERNS.items():
         full_path = project_root / file_path
-        version = extract_version(full_path, pattern)
+        version = extract_version(full_path, pattern, VERSION_LINE_PREFIXES.get(file_path))
 
         if version:
             versions[file_path] = version
@@ -72,8 +99,8 @@ def check_versions():
 
     changelog_path = project_root / "CHANGELOG.md"
     if changelog_path.exists():
-        content = changelog_path.read_text()
-        match = re.search(CHANGELOG_PATTERN, content)
+        content = read_file(changelog_path)
+        match = CHANGELOG_PATTERN.search(content)
         if match:
             changelog_version = match.group(1)
             versions["CHANGELOG.md"] = changelog_version
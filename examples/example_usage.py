@@ -19,17 +19,13 @@ def example_static_frame():
     
     # Create a simple gradient test image
     width, height = 1920, 1080
-    frame = np.zeros((height, width, 3), dtype=np.uint8)
-    
-    # Create a gradient pattern
-    for y in range(height):
-        for x in range(width):
-            frame[y, x] = [
-                int(255 * x / width),      # Red gradient
-                int(255 * y / height),     # Green gradient
-                128                        # Blue constant
-            ]
-    
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+
+    # Create a gradient pattern (broadcast row/column ramps instead of per-pixel loops)
+    frame[:, :, 0] = (np.arange(width) * 255 // width)[np.newaxis, :]    # Red gradient
+    frame[:, :, 1] = (np.arange(height) * 255 // height)[:, np.newaxis]  # Green gradient
+    frame[:, :, 2] = 128                                                 # Blue constant
+
     # Display the frame
     with BlackmagicOutput() as output:
         devices = output.get_available_devices()
@@ -105,14 +101,14 @@ def example_test_patterns():
         width, height = mode_info['width'], mode_info['height']
         print(f"Display mode: {width}x{height} @ {mode_info['framerate']}fps")
         
+        # Create all test patterns up front so the display loop only switches frames
+        pattern_frames = {name: create_test_pattern(width, height, name) for name in patterns}
+
         print("Cycling through test patterns. Press Ctrl+C to stop...")
         try:
-            for pattern_name in patterns:
+            for pattern_name, frame in pattern_frames.items():
                 print(f"Displaying {pattern_name} pattern")
-                
-                # Create test pattern
-                frame = create_test_pattern(width, height, pattern_name)
-                
+
                 if output.display_static_frame(frame, DisplayMode.HD1080p25):
                     time.sleep(3)  # Display each pattern for 3 seconds
                 else:
@@ -134,11 +130,12 @@ def example_dynamic_updates():
         mode_info = output.get_display_mode_info(DisplayMode.HD1080p25)
         width, height = mode_info['width'], mode_info['height']
 
-        # Create initial frame
+        # Create initial frame (C-contiguous, so update_frame never needs to copy it)
         frame = np.zeros((height, width, 3), dtype=np.uint8)
 
-        # Pre-compute coordinate array for fast vectorized operations
-        y_coords = np.arange(height).reshape(-1, 1)
+        # Colors as uint8 arrays so each fill is a plain broadcast copy
+        background_color = np.array([0, 0, 100], dtype=np.uint8)   # Dark blue
+        bar_color = np.array([255, 255, 255], dtype=np.uint8)      # White
 
         # Start with initial frame
         if not output.display_static_frame(frame, DisplayMode.HD1080p25):
@@ -148,25 +145,33 @@ def example_dynamic_updates():
         print("Starting dynamic animation (optimized with NumPy)...")
         print("Press Ctrl+C to stop...\n")
 
+        # Paint the background once; the loop only touches the bar rows after this.
+        # Every other row keeps its background value across frames, so there is
+        # deliberately no per-frame clear. Any new pattern that does not restore
+        # the rows it overwrites must clear them itself, not the whole frame.
+        frame[:] = background_color
+        bar_height = 40
+        prev_bar_position = 0
+
         try:
             frame_count = 0
             start_time = time.perf_counter()
             last_report = start_time
-            target_frame_time = 0.039  # 39ms to account for timing overhead, targets ~25.6 FPS
+            frame_duration = 1.0 / mode_info['framerate']
+            next_deadline = start_time
+            spin_window = 0.0005  # Busy-wait at most 0.5ms per frame
 
             while True:
-                frame_start = time.perf_counter()
-
                 # Calculate bar position (moves down the screen)
                 bar_position = (frame_count * 4) % height
 
                 # Vectorized pattern generation (much faster than nested Python loops)
-                # Creates a moving horizontal white bar on blue background
-                bar_mask = (y_coords >= bar_position) & (y_coords < bar_position + 40)
-
-                # Update frame using NumPy array operations
-                frame[:] = [0, 0, 100]  # Dark blue background
-                frame[bar_mask.squeeze()] = [255, 255, 255]  # White bar
+                # Creates a moving horizontal white bar on blue background.
+                # Only the rows that change are written: the old bar is restored
+                # to background, then the bar is painted at its new position.
+                frame[prev_bar_position:prev_bar_position + bar_height] = background_color
+                frame[bar_position:bar_position + bar_height] = bar_color
+                prev_bar_position = bar_position
 
                 # Update the frame
                 if not output.update_frame(frame):
@@ -183,16 +188,20 @@ def example_dynamic_updates():
                     print(f"Frame {frame_count:4d}  |  Elapsed: {elapsed:6.2f}s  |  FPS: {actual_fps:5.2f}")
                     last_report = current_time
 
-                # Smart sleep: only sleep if we're ahead of schedule
-                frame_time = time.perf_counter() - frame_start
-                time_remaining = target_frame_time - frame_time
-                if time_remaining > 0.003:  # Only sleep if >3ms remaining
-                    # Sleep most of the remaining time, leaving a small buffer for jitter
-                    time.sleep(time_remaining - 0.002)
-                elif time_remaining > 0:
-                    # Busy-wait for the last few milliseconds for precision
-                    while time.perf_counter() - frame_start < target_frame_time:
+                # Pace against absolute deadlines so per-frame work time
+                # doesn't accumulate as drift below the target frame rate
+                next_deadline += frame_duration
+                time_remaining = next_deadline - time.perf_counter()
+                if time_remaining > spin_window:
+                    # Sleep until just before the deadline so the core stays idle
+                    time.sleep(time_remaining - spin_window)
+                if time_remaining > 0:
+                    # Busy-wait only the final fraction of a millisecond for precision
+                    while time.perf_counter() < next_deadline:
                         pass
+                else:
+                    # Behind schedule (dropped frame): resync rather than bursting to catch up
+                    next_deadline = time.perf_counter()
 
         except KeyboardInterrupt:
             elapsed = time.perf_counter() - start_time
@@ -217,33 +226,52 @@ def example_from_image_file():
     # Try to find an image file in current directory
     # Note: 16-bit PNGs may be converted to 8-bit by PIL/imageio
     # Use TIFF for reliable 16-bit support
-    image_files = [f for f in os.listdir('.') if f.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.exr'))]
+    image_extensions = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.exr'})
+    with os.scandir('.') as entries:
+        image_path = next((entry.name for entry in entries
+                           if entry.is_file() and os.path.splitext(entry.name)[1].lower() in image_extensions),
+                          None)
 
-    if not image_files:
+    if image_path is None:
         print("No image files found in current directory")
         print("Please place a PNG, JPG, BMP, TIFF, or EXR file in the current directory")
         return
 
-    image_path = image_files[0]
     print(f"Loading image: {image_path}")
 
     # Load image (preserves bit depth)
     frame = iio.imread(image_path)
     print(f"Loaded image: dtype={frame.dtype}, shape={frame.shape}")
 
-    # Resize if needed using PIL (preserves dtype via imageio)
-    if frame.shape[0] != 1080 or frame.shape[1] != 1920:
-        from PIL import Image
-        img = Image.fromarray(frame)
-        img = img.resize((1920, 1080), Image.Resampling.LANCZOS)
-        frame = np.array(img)
-        print(f"Resized to 1920x1080")
-
-    # Ensure RGB format (remove alpha if present)
+    # Ensure RGB format (remove alpha if present). Done before resizing so the
+    # discarded alpha channel is never resampled.
     if frame.ndim == 3 and frame.shape[2] == 4:
-        frame = frame[:, :, :3]  # Drop alpha channel
+        frame = np.ascontiguousarray(frame[:, :, :3])  # Drop alpha channel (copy once, not per output)
         print("Removed alpha channel")
 
+    # Resize if needed. OpenCV is used when available (fast, and preserves
+    # uint8/uint16/float32 dtypes); otherwise fall back to PIL.
+    if frame.shape[0] != 1080 or frame.shape[1] != 1920:
+        try:
+            import cv2
+        except ImportError:
+            cv2 = None
+
+        if cv2 is not None and frame.dtype in (np.uint8, np.uint16, np.float32):
+            # Area averaging for downscaling, Lanczos for upscaling
+            if frame.shape[0] > 1080 or frame.shape[1] > 1920:
+                interpolation = cv2.INTER_AREA
+            else:
+                interpolation = cv2.INTER_LANCZOS4
+            frame = cv2.resize(frame, (1920, 1080), interpolation=interpolation)
+        else:
+            from PIL import Image
+            img = Image.fromarray(frame)
+            # reducing_gap does a fast box reduction first when downscaling large images
+            img = img.resize((1920, 1080), Image.Resampling.LANCZOS, reducing_gap=3.0)
+            frame = np.asarray(img)  # View of the resized image, no extra copy
+        print(f"Resized to 1920x1080")
+
     # Display the image (format auto-detected based on dtype)
     with BlackmagicOutput() as output:
         if output.initialize():
@@ -23,12 +23,11 @@ def main():
 
     # Create HDR test frame (float values, normalized 0.0-1.0)
     width, height = 1920, 1080
-    frame = np.ones((height, width, 3), dtype=np.float32)
+    frame = np.empty((height, width, 3), dtype=np.float32)
 
-    # Create a gradient
-    for y in range(height):
-        intensity = y / height  # 0.0 to 1.0
-        frame[y, :, :] = intensity
+    # Create a gradient (one intensity per row, broadcast across the row)
+    intensity = np.arange(height) / height  # 0.0 to 1.0
+    frame[:] = intensity[:, np.newaxis, np.newaxis]
 
     print("Displaying HDR PQ frame with Rec.2020 matrix...")
 
@@ -67,7 +66,7 @@ def example_with_custom_metadata():
 
     # Create test frame
     width, height = 1920, 1080
-    frame = np.ones((height, width, 3), dtype=np.float32) * 0.5
+    frame = np.full((height, width, 3), 0.5, dtype=np.float32)
 
     # Create custom HDR metadata
     import decklink_output as dl
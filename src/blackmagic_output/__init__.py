@@ -31,6 +31,8 @@ try:
     # Import C++ conversion functions with underscore prefix
     from decklink_output import (
         rgb_to_bgra as _rgb_to_bgra,
+        rgb_uint16_to_bgra as _rgb_uint16_to_bgra,
+        rgb_float_to_bgra as _rgb_float_to_bgra,
         rgb_uint16_to_yuv10 as _rgb_uint16_to_yuv10,
         rgb_float_to_yuv10 as _rgb_float_to_yuv10,
         rgb_uint16_to_rgb10 as _rgb_uint16_to_rgb10,
@@ -39,45 +41,135 @@ try:
         rgb_float_to_rgb12 as _rgb_float_to_rgb12,
     )
 
+    def _frame_size(rgb_array, width, height):
+        """Fill in width/height from an HxWxC array when not given explicitly.
+
+        Arrays with fewer than two dimensions get 0, so the conversion function's
+        own shape check reports the error.
+        """
+        has_size = rgb_array.ndim >= 2
+        if width is None:
+            width = rgb_array.shape[1] if has_size else 0
+        if height is None:
+            height = rgb_array.shape[0] if has_size else 0
+        return width, height
+
     # Wrap conversion functions to ensure C-contiguous arrays
-    def rgb_to_bgra(rgb_array, width, height):
+    def rgb_to_bgra(rgb_array, width=None, height=None, out=None):
         """Convert RGB numpy array to BGRA format.
 
         Automatically converts input array to C-contiguous layout if needed.
 
         Args:
             rgb_array: HxWx3 RGB array (uint8)
-            width: Image width
-            height: Image height
+            width: Image width (default: taken from rgb_array.shape)
+            height: Image height (default: taken from rgb_array.shape)
+            out: Optional writable, C-contiguous uint8 array of the result's size to
+                 write into and return instead of allocating. Default: None
+
+        Returns:
+            HxWx4 BGRA array (uint8)
+        """
+        rgb_array = np.ascontiguousarray(rgb_array)
+        width, height = _frame_size(rgb_array, width, height)
+        return _rgb_to_bgra(rgb_array, width, height, out=out)
+
+    def rgb_uint16_to_bgra(rgb_array, width=None, height=None, out=None):
+        """Convert RGB uint16 numpy array to 8-bit BGRA format.
+
+        Automatically converts input array to C-contiguous layout if needed.
+
+        Args:
+            rgb_array: HxWx3 RGB array (uint16, 0-65535; the top 8 bits are used)
+            width: Image width (default: taken from rgb_array.shape)
+            height: Image height (default: taken from rgb_array.shape)
+            out: Optional writable, C-contiguous uint8 array of the result's size to
+                 write into and return instead of allocating. Default: None
+
+        Returns:
+            HxWx4 BGRA array (uint8)
+        """
+        rgb_array = np.ascontiguousarray(rgb_array)
+        width, height = _frame_size(rgb_array, width, height)
+        return _rgb_uint16_to_bgra(rgb_array, width, height, out=out)
+
+    def rgb_float_to_bgra(rgb_array, width=None, height=None, out=None):
+        """Convert RGB float numpy array to 8-bit BGRA format.
+
+        Automatically converts input array to C-contiguous layout if needed.
+        Values outside 0.0-1.0 are clamped to 0-255.
+
+        Args:
+            rgb_array: HxWx3 RGB array (float, 0.0-1.0 full range)
+            width: Image width (default: taken from rgb_array.shape)
+            height: Image height (default: taken from rgb_array.shape)
+            out: Optional writable, C-contiguous uint8 array of the result's size to
+                 write into and return instead of allocating. Default: None
 
         Returns:
             HxWx4 BGRA array (uint8)
         """
         rgb_array = np.ascontiguousarray(rgb_array)
-        return _rgb_to_bgra(rgb_array, width, height)
+        width, height = _frame_size(rgb_array, width, height)
+        return _rgb_float_to_bgra(rgb_array, width, height, out=out)
 
-    def rgb_uint16_to_yuv10(rgb_array, width, height, matrix=Gamut.Rec709, input_narrow_range=False, output_narrow_range=True):
+    def rgb_uint16_to_yuv10(rgb_array, width=None, height=None, matrix=Gamut.Rec709, input_narrow_range=False, output_narrow_range=True, out=None):
         """Convert RGB uint16 numpy array to 10-bit YUV v210 format.
 
         Automatically converts input array to C-contiguous layout if needed.
 
         Args:
             rgb_array: HxWx3 RGB array (uint16)
-            width: Image width
-            height: Image height
+            width: Image width (default: taken from rgb_array.shape)
+            height: Image height (default: taken from rgb_array.shape)
             matrix: Color matrix (Rec601, Rec709, or Rec2020)
             input_narrow_range: If True, input is narrow range (64-940 @10-bit, i.e., 4096-60160 @16-bit).
                               If False, input is full range (0-65535). Default: False
             output_narrow_range: If True, output YUV is narrow range (Y: 64-940, CbCr: 64-960).
                                If False, output is full range (0-1023). Default: True
+            out: Optional writable, C-contiguous uint8 array of the result's size to
+                 write into and return instead of allocating. Default: None
 
         Returns:
             Flat uint8 array in v210 format
         """
         rgb_array = np.ascontiguousarray(rgb_array)
-        return _rgb_uint16_to_yuv10(rgb_array, width, height, matrix, input_narrow_range, output_narrow_range)
+        width, height = _frame_size(rgb_array, width, height)
+        return _rgb_uint16_to_yuv10(rgb_array, width, height, matrix, input_narrow_range, output_narrow_range, out=out)
+
+    def rgb_uint16_planes_to_yuv10(planes, width=None, height=None, matrix=Gamut.Rec709, input_narrow_range=False, output_narrow_range=True, out=None):
+        """Convert planar RGB uint16 data to 10-bit YUV v210 format.
+
+        Same conversion as rgb_uint16_to_yuv10(), for pipelines that keep R, G and B
+        as separate planes. The 3xHxW array is read in place (no interleaving copy).
+        Three separate HxW planes must be stacked by the caller (e.g. np.stack),
+        which copies them.
+
+        Args:
+            planes: 3xHxW R, G, B array (uint16)
+            width: Image width (default: taken from planes.shape)
+            height: Image height (default: taken from planes.shape)
+            matrix: Color matrix (Rec601, Rec709, or Rec2020)
+            input_narrow_range: If True, input is narrow range (64-940 @10-bit, i.e., 4096-60160 @16-bit).
+                              If False, input is full range (0-65535). Default: False
+            output_narrow_range: If True, output YUV is narrow range (Y: 64-940, CbCr: 64-960).
+                               If False, output is full range (0-1023). Default: True
+            out: Optional writable, C-contiguous uint8 array of the result's size to
+                 write into and return instead of allocating. Default: None
 
-    def rgb_float_to_yuv10(rgb_array, width, height, matrix=Gamut.Rec709, output_narrow_range=True):
+        Returns:
+            Flat uint8 array in v210 format
+        """
+        if not isinstance(planes, np.ndarray) or planes.dtype != np.uint16:
+            raise TypeError("planes must be a uint16 NumPy array")
+        if planes.ndim != 3 or planes.shape[0] != 3:
+            raise ValueError("planes must be 3xHxW (R, G, B planes)")
+        # HxWx3 view with a channel stride of one plane; the C++ side honours it
+        rgb_array = np.moveaxis(planes, 0, -1)
+        width, height = _frame_size(rgb_array, width, height)
+        return _rgb_uint16_to_yuv10(rgb_array, width, height, matrix, input_narrow_range, output_narrow_range, out=out)
+
+    def rgb_float_to_yuv10(rgb_array, width=None, height=None, matrix=Gamut.Rec709, output_narrow_range=True, out=None):
         """Convert RGB float numpy array to 10-bit YUV v210 format.
 
         Automatically converts input array to C-contiguous layout if needed.
@@ -88,77 +180,89 @@ try:
 
         Args:
             rgb_array: HxWx3 RGB array (float, 0.0-1.0 full range)
-            width: Image width
-            height: Image height
+            width: Image width (default: taken from rgb_array.shape)
+            height: Image height (default: taken from rgb_array.shape)
             matrix: Color matrix (Rec601, Rec709, or Rec2020)
             output_narrow_range: If True, output YUV is narrow range (Y: 64-940, CbCr: 64-960).
                                If False, output is full range (0-1023). Default: True
+            out: Optional writable, C-contiguous uint8 array of the result's size to
+                 write into and return instead of allocating. Default: None
 
         Returns:
             Flat uint8 array in v210 format
         """
         rgb_array = np.ascontiguousarray(rgb_array)
-        return _rgb_float_to_yuv10(rgb_array, width, height, matrix, output_narrow_range)
+        width, height = _frame_size(rgb_array, width, height)
+        return _rgb_float_to_yuv10(rgb_array, width, height, matrix, output_narrow_range, out=out)
 
-    def rgb_uint16_to_rgb10(rgb_array, width, height, input_narrow_range=True, output_narrow_range=True):
+    def rgb_uint16_to_rgb10(rgb_array, width=None, height=None, input_narrow_range=True, output_narrow_range=True, out=None):
         """Convert RGB uint16 numpy array to 10-bit RGB r210 format.
 
         Automatically converts input array to C-contiguous layout if needed.
 
         Args:
             rgb_array: HxWx3 RGB array (uint16)
-            width: Image width
-            height: Image height
+            width: Image width (default: taken from rgb_array.shape)
+            height: Image height (default: taken from rgb_array.shape)
             input_narrow_range: If True, input is narrow range (64-940 @10-bit, i.e., 4096-60160 @16-bit).
                               If False, input is full range (0-65535). Default: True
             output_narrow_range: If True, output is narrow range (64-940).
                                If False, output is full range (0-1023). Default: True
+            out: Optional writable, C-contiguous uint8 array of the result's size to
+                 write into and return instead of allocating. Default: None
 
         Returns:
             Flat uint8 array in r210 format
         """
         rgb_array = np.ascontiguousarray(rgb_array)
-        return _rgb_uint16_to_rgb10(rgb_array, width, height, input_narrow_range, output_narrow_range)
+        width, height = _frame_size(rgb_array, width, height)
+        return _rgb_uint16_to_rgb10(rgb_array, width, height, input_narrow_range, output_narrow_range, out=out)
 
-    def rgb_float_to_rgb10(rgb_array, width, height, output_narrow_range=True):
+    def rgb_float_to_rgb10(rgb_array, width=None, height=None, output_narrow_range=True, out=None):
         """Convert RGB float numpy array to 10-bit RGB r210 format.
 
         Automatically converts input array to C-contiguous layout if needed.
 
         Args:
             rgb_array: HxWx3 RGB array (float, 0.0-1.0 full range)
-            width: Image width
-            height: Image height
+            width: Image width (default: taken from rgb_array.shape)
+            height: Image height (default: taken from rgb_array.shape)
             output_narrow_range: If True, map 0.0-1.0 to 64-940 (narrow range).
                                If False, map 0.0-1.0 to 0-1023 (full range). Default: True
+            out: Optional writable, C-contiguous uint8 array of the result's size to
+                 write into and return instead of allocating. Default: None
 
         Returns:
             Flat uint8 array in r210 format
         """
         rgb_array = np.ascontiguousarray(rgb_array)
-        return _rgb_float_to_rgb10(rgb_array, width, height, output_narrow_range)
+        width, height = _frame_size(rgb_array, width, height)
+        return _rgb_float_to_rgb10(rgb_array, width, height, output_narrow_range, out=out)
 
-    def rgb_uint16_to_rgb12(rgb_array, width, height, input_narrow_range=False, output_narrow_range=False):
+    def rgb_uint16_to_rgb12(rgb_array, width=None, height=None, input_narrow_range=False, output_narrow_range=False, out=None):
         """Convert RGB uint16 numpy array to 12-bit RGB format.
 
         Automatically converts input array to C-contiguous layout if needed.
 
         Args:
             rgb_array: HxWx3 RGB array (uint16)
-            width: Image width
-            height: Image height
+            width: Image width (default: taken from rgb_array.shape)
+            height: Image height (default: taken from rgb_array.shape)
             input_narrow_range: If True, input is narrow range (64-940 @12-bit, i.e., 4096-60160 @16-bit).
                               If False, input is full range (0-65535). Default: False
             output_narrow_range: If True, output is narrow range (256-3760).
                                If False, output is full range (0-4095). Default: False
+            out: Optional writable, C-contiguous uint8 array of the result's size to
+                 write into and return instead of allocating. Default: None
 
         Returns:
             Flat uint8 array in 12-bit RGB format
         """
         rgb_array = np.ascontiguousarray(rgb_array)
-        return _rgb_uint16_to_rgb12(rgb_array, width, height, input_narrow_range, output_narrow_range)
+        width, height = _frame_size(rgb_array, width, height)
+        return _rgb_uint16_to_rgb12(rgb_array, width, height, input_narrow_range, output_narrow_range, out=out)
 
-    def rgb_float_to_rgb12(rgb_array, width, height, output_narrow_range=False):
+    def rgb_float_to_rgb12(rgb_array, width=None, height=None, output_narrow_range=False, out=None):
         """Convert RGB float numpy array to 12-bit RGB format.
 
         Automatically converts input array to C-contiguous layout if needed.
@@ -167,16 +271,19 @@ try:
 
         Args:
             rgb_array: HxWx3 RGB array (float, 0.0-1.0 full range)
-            width: Image width
-            height: Image height
+            width: Image width (default: taken from rgb_array.shape)
+            height: Image height (default: taken from rgb_array.shape)
             output_narrow_range: If True, map 0.0-1.0 to 256-3760 (narrow range).
                                If False, map 0.0-1.0 to 0-4095 (full range). Default: False
+            out: Optional writable, C-contiguous uint8 array of the result's size to
+                 write into and return instead of allocating. Default: None
 
         Returns:
             Flat uint8 array in 12-bit RGB format
         """
         rgb_array = np.ascontiguousarray(rgb_array)
-        return _rgb_float_to_rgb12(rgb_array, width, height, output_narrow_range)
+        width, height = _frame_size(rgb_array, width, height)
+        return _rgb_float_to_rgb12(rgb_array, width, height, output_narrow_range, out=out)
 
 except ImportError:
     # C++ extension not built yet
@@ -201,7 +308,10 @@ __all__ = [
     "Gamut",
     # Conversion utilities
     "rgb_to_bgra",
+    "rgb_uint16_to_bgra",
+    "rgb_float_to_bgra",
     "rgb_uint16_to_yuv10",
+    "rgb_uint16_planes_to_yuv10",
     "rgb_float_to_yuv10",
     "rgb_uint16_to_rgb10",
     "rgb_float_to_rgb10",
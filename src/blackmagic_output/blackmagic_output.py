@@ -192,9 +192,12 @@ class BlackmagicOutput:
         self._initialized = False
         self._output_started = False
         self._current_settings = None
+        self._current_pixel_format = None
         self._current_matrix = Matrix.Rec709
         self._current_input_narrow_range = False
         self._current_output_narrow_range = True
+        self._settings_cache = {}
+        self._output_buffers = {}
 
     def initialize(self, device_index: int = 0) -> bool:
         """
@@ -208,6 +211,7 @@ class BlackmagicOutput:
         """
         if self._device.initialize(device_index):
             self._initialized = True
+            self._settings_cache.clear()
             return True
         return False
 
@@ -247,11 +251,18 @@ class BlackmagicOutput:
         """
         Display a static frame continuously.
 
+        Not thread-safe: converted frames are written into a buffer shared by
+        calls on this instance, so call this and update_frame() from one thread.
+
         Args:
             frame_data: NumPy array containing image data
                        - For RGB: shape should be (height, width, 3)
                        - For BGRA: shape should be (height, width, 4)
                        - Supported dtypes: uint8, uint16, float32, float64
+                       - Non-contiguous uint8 arrays are copied before output
+                       - For BGRA output, uint16 (0-65535) and float (0.0-1.0) RGB
+                         or BGRA are scaled to 8-bit, saturating out-of-range values;
+                         alpha of uint16/float BGRA input is replaced with opaque
             display_mode: Video resolution and frame rate
             pixel_format: Pixel format (default: YUV10, auto-detected as BGRA for uint8 data)
             matrix: R'G'B' to Y'CbCr conversion matrix (Rec601, Rec709 or Rec2020).
@@ -327,6 +338,7 @@ class BlackmagicOutput:
             if not self._device.setup_output(settings):
                 return False
             self._current_settings = settings
+            self._current_pixel_format = pixel_format
 
         processed_frame = self._prepare_frame_data(frame_data, pixel_format, matrix, input_narrow_range, output_narrow_range)
 
@@ -390,7 +402,7 @@ class BlackmagicOutput:
             if not self.initialize():
                 return False
 
-        settings = self._device.get_video_settings(display_mode.value)
+        settings = self._get_video_settings(display_mode)
 
         is_float = isinstance(color[0], float)
 
@@ -440,28 +452,21 @@ class BlackmagicOutput:
     def update_frame(self, frame_data: np.ndarray) -> bool:
         """
         Update the currently displayed frame with new data.
-        
+
+        Not thread-safe: converted frames are written into a buffer shared by
+        calls on this instance, so call this and display_static_frame() from one thread.
+
         Args:
-            frame_data: NumPy array containing new image data
-            
+            frame_data: NumPy array containing new image data. For repeated
+                       updates, pass a C-contiguous array to avoid a copy per frame.
+
         Returns:
             True if successful, False otherwise
         """
         if not self._output_started:
             raise RuntimeError("Output not started. Call display_static_frame() first.")
 
-        if self._current_settings.format == _decklink.PixelFormat.BGRA:
-            pixel_format = PixelFormat.BGRA
-        elif self._current_settings.format == _decklink.PixelFormat.YUV10:
-            pixel_format = PixelFormat.YUV10
-        elif self._current_settings.format == _decklink.PixelFormat.RGB10:
-            pixel_format = PixelFormat.RGB10
-        elif self._current_settings.format == _decklink.PixelFormat.RGB12:
-            pixel_format = PixelFormat.RGB12
-        else:
-            raise RuntimeError(f"Unsupported pixel format in current settings: {self._current_settings.format}")
-
-        processed_frame = self._prepare_frame_data(frame_data, pixel_format, self._current_matrix,
+        processed_frame = self._prepare_frame_data(frame_data, self._current_pixel_format, self._current_matrix,
                                                   self._current_input_narrow_range, self._current_output_narrow_range)
 
         if not self._device.set_frame_data(processed_frame):
@@ -489,6 +494,45 @@ class BlackmagicOutput:
         self.stop()
         self._device.cleanup()
         self._initialized = False
+        self._settings_cache.clear()
+        self._output_buffers = {}
+
+    def _get_video_settings(self, display_mode: DisplayMode):
+        """
+        Get the device's video settings for a display mode, cached per mode.
+
+        The returned object is shared between calls, so it must not be modified.
+        Only settings from an initialized device are cached (an uninitialized
+        device reports defaults).
+        """
+        settings = self._settings_cache.get(display_mode.value)
+        if settings is None:
+            settings = self._device.get_video_settings(display_mode.value)
+            if self._initialized:
+                self._settings_cache[display_mode.value] = settings
+        return settings
+
+    def _convert(self, convert, frame_data: np.ndarray, *args) -> np.ndarray:
+        """
+        Run a conversion function at the current output size into a reused buffer.
+
+        The result of each conversion is kept and passed back as out= on the next
+        call with the same function and size, so steady-state updates allocate
+        nothing. This is safe because set_frame_data() copies the data before the
+        buffer is written again.
+
+        The returned array is only valid until the next conversion with the same
+        function and size, which overwrites it in place. Copy it to keep a frame,
+        e.g. when handing it to another thread.
+        """
+        settings = self._current_settings
+        key = (convert, settings.width, settings.height)
+        out = self._output_buffers.get(key)
+        result = convert(frame_data, settings.width, settings.height, *args, out=out)
+        if out is None:
+            # Only keep the buffer for the format and size currently in use
+            self._output_buffers = {key: result}
+        return result
 
     def _prepare_frame_data(self, frame_data: np.ndarray,
                           pixel_format: PixelFormat,
@@ -511,14 +555,29 @@ class BlackmagicOutput:
         if not isinstance(frame_data, np.ndarray):
             raise TypeError("frame_data must be a NumPy array")
 
-        settings = self._current_settings
-
         if pixel_format == PixelFormat.BGRA:
+            if (frame_data.ndim == 3 and frame_data.shape[2] == 4
+                    and frame_data.dtype in (np.uint16, np.float32, np.float64)):
+                # Wider BGRA goes through the R'G'B' kernels as a channel-reversed
+                # view; alpha is dropped and output opaque
+                frame_data = frame_data[:, :, 2::-1]
+
+            if frame_data.ndim == 3 and frame_data.shape[2] == 3:
+                # Scale and saturate wider R'G'B' to 8-bit in the same pass as the repack
+                if frame_data.dtype == np.uint16:
+                    return self._convert(_decklink.rgb_uint16_to_bgra, frame_data)
+                elif frame_data.dtype in (np.float32, np.float64):
+                    return self._convert(_decklink.rgb_float_to_bgra, frame_data)
+
             if frame_data.dtype != np.uint8:
                 frame_data = frame_data.astype(np.uint8)
 
+            # BGRA data is read as a flat buffer, so strided views (e.g. after
+            # dropping alpha or reversing channels) must be made contiguous
+            frame_data = np.ascontiguousarray(frame_data)
+
             if frame_data.ndim == 3 and frame_data.shape[2] == 3:
-                return _decklink.rgb_to_bgra(frame_data, settings.width, settings.height)
+                return self._convert(_decklink.rgb_to_bgra, frame_data)
             elif frame_data.ndim == 3 and frame_data.shape[2] == 4:
                 return frame_data
             else:
@@ -531,11 +590,11 @@ class BlackmagicOutput:
             internal_matrix = matrix.value
 
             if frame_data.dtype == np.uint16:
-                return _decklink.rgb_uint16_to_yuv10(frame_data, settings.width, settings.height,
-                                                     internal_matrix, input_narrow_range, output_narrow_range)
+                return self._convert(_decklink.rgb_uint16_to_yuv10, frame_data,
+                                     internal_matrix, input_narrow_range, output_narrow_range)
             elif frame_data.dtype in (np.float32, np.float64):
-                return _decklink.rgb_float_to_yuv10(frame_data.astype(np.float32), settings.width, settings.height,
-                                                    internal_matrix, output_narrow_range)
+                return self._convert(_decklink.rgb_float_to_yuv10, frame_data,
+                                     internal_matrix, output_narrow_range)
             else:
                 raise ValueError("For YUV10 format, frame data must be uint16 or float dtype")
 
@@ -544,11 +603,11 @@ class BlackmagicOutput:
                 raise ValueError("For RGB10 format, frame data must be HxWx3 (RGB)")
 
             if frame_data.dtype == np.uint16:
-                return _decklink.rgb_uint16_to_rgb10(frame_data, settings.width, settings.height,
-                                                     input_narrow_range, output_narrow_range)
+                return self._convert(_decklink.rgb_uint16_to_rgb10, frame_data,
+                                     input_narrow_range, output_narrow_range)
             elif frame_data.dtype in (np.float32, np.float64):
-                return _decklink.rgb_float_to_rgb10(frame_data.astype(np.float32), settings.width, settings.height,
-                                                    output_narrow_range)
+                return self._convert(_decklink.rgb_float_to_rgb10, frame_data,
+                                     output_narrow_range)
             else:
                 raise ValueError("For RGB10 format, frame data must be uint16 or float dtype")
 
@@ -557,11 +616,11 @@ class BlackmagicOutput:
                 raise ValueError("For RGB12 format, frame data must be HxWx3 (RGB)")
 
             if frame_data.dtype == np.uint16:
-                return _decklink.rgb_uint16_to_rgb12(frame_data, settings.width, settings.height,
-                                                     input_narrow_range, output_narrow_range)
+                return self._convert(_decklink.rgb_uint16_to_rgb12, frame_data,
+                                     input_narrow_range, output_narrow_range)
             elif frame_data.dtype in (np.float32, np.float64):
-                return _decklink.rgb_float_to_rgb12(frame_data.astype(np.float32), settings.width, settings.height,
-                                                    output_narrow_range)
+                return self._convert(_decklink.rgb_float_to_rgb12, frame_data,
+                                     output_narrow_range)
             else:
                 raise ValueError("For RGB12 format, frame data must be uint16 or float dtype")
 
@@ -580,7 +639,7 @@ class BlackmagicOutput:
         Returns:
             Dictionary with width, height, and framerate information
         """
-        settings = self._device.get_video_settings(display_mode.value)
+        settings = self._get_video_settings(display_mode)
         return {
             'width': settings.width,
             'height': settings.height,
@@ -667,12 +726,13 @@ def create_test_pattern(width: int, height: int, pattern: str = 'gradient', grad
     frame = np.zeros((height, width, 3), dtype=np.float32)
 
     if pattern == 'gradient':
-        for x in range(width):
-            frame[:, x, :] = [grad_start + (grad_end - grad_start) * x / (width - 1)]
+        # One row of ramp values, broadcast down every row and across channels
+        ramp = grad_start + (grad_end - grad_start) * np.arange(width) / (width - 1)
+        frame[:] = ramp[:, None]
 
     elif pattern == 'bars':
         bar_width = width // 8
-        colors = [
+        colors = np.array([
             [1.0, 1.0, 1.0],      # White
             [1.0, 1.0, 0.0],      # Yellow
             [0.0, 1.0, 1.0],      # Cyan
@@ -681,19 +741,17 @@ def create_test_pattern(width: int, height: int, pattern: str = 'gradient', grad
             [1.0, 0.0, 0.0],      # Red
             [0.0, 0.0, 1.0],      # Blue
             [0.0, 0.0, 0.0]       # Black
-        ]
+        ], dtype=np.float32)
 
-        for x in range(width):
-            color_idx = min(x // bar_width, 7)
-            frame[:, x] = colors[color_idx]
+        # Look up one row of bar colors, then broadcast it down every row
+        color_idx = np.minimum(np.arange(width) // bar_width, 7)
+        frame[:] = colors[color_idx]
 
     elif pattern == 'checkerboard':
         checker_size = 32
-        for y in range(height):
-            for x in range(width):
-                if ((x // checker_size) + (y // checker_size)) % 2:
-                    frame[y, x] = [1.0, 1.0, 1.0]      # White
-                else:
-                    frame[y, x] = [0.0, 0.0, 0.0]      # Black
+        # White (1) where the checker row and column parities differ, else black (0)
+        checker_y = (np.arange(height) // checker_size % 2)[:, None]
+        checker_x = (np.arange(width) // checker_size % 2)[None, :]
+        frame[:] = (checker_x ^ checker_y)[:, :, None]
 
     return frame
\ No newline at end of file
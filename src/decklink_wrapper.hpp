@@ -243,6 +243,11 @@ private:
     VideoSettings m_currentSettings;
     std::vector<uint8_t> m_frameBuffer;
     std::mutex m_frameBufferMutex;
+    // Serialises device and output state (setup, display, stop, cleanup, HDR
+    // metadata), since the Python bindings release the GIL around display.
+    // Recursive because cleanup() calls stopOutput(). Taken before
+    // m_frameBufferMutex when both are needed
+    std::recursive_mutex m_deviceMutex;
     std::atomic<bool> m_outputEnabled;
 
     BMDTimeValue m_frameDuration;
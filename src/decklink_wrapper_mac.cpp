@@ -24,6 +24,7 @@ DeckLinkOutput::~DeckLinkOutput()
 
 bool DeckLinkOutput::initialize(int deviceIndex)
 {
+    std::lock_guard<std::recursive_mutex> lock(m_deviceMutex);
     IDeckLinkIterator* deckLinkIterator = CreateDeckLinkIteratorInstance();
     if (!deckLinkIterator) {
         std::cerr << "Could not create DeckLink iterator" << std::endl;
@@ -64,6 +65,7 @@ bool DeckLinkOutput::initialize(int deviceIndex)
 
 bool DeckLinkOutput::setupOutput(const VideoSettings& settings)
 {
+    std::lock_guard<std::recursive_mutex> lock(m_deviceMutex);
     if (!m_deckLinkOutput) {
         std::cerr << "DeckLink output not initialized" << std::endl;
         return false;
@@ -153,7 +155,10 @@ bool DeckLinkOutput::setupOutput(const VideoSettings& settings)
             break;
     }
 
-    m_frameBuffer.resize(frameSize);
+    {
+        std::lock_guard<std::mutex> bufferLock(m_frameBufferMutex);
+        m_frameBuffer.resize(frameSize);
+    }
     
     return true;
 }
@@ -218,6 +223,7 @@ bool DeckLinkOutput::createFrame(IDeckLinkMutableVideoFrame** frame)
 
 bool DeckLinkOutput::displayFrame()
 {
+    std::lock_guard<std::recursive_mutex> lock(m_deviceMutex);
     if (!m_deckLinkOutput) {
         std::cerr << "DeckLink output not initialized" << std::endl;
         return false;
@@ -252,6 +258,7 @@ bool DeckLinkOutput::displayFrame()
 
 bool DeckLinkOutput::stopOutput()
 {
+    std::lock_guard<std::recursive_mutex> lock(m_deviceMutex);
     if (m_outputEnabled && m_deckLinkOutput) {
         m_deckLinkOutput->DisableVideoOutput();
         m_outputEnabled = false;
@@ -262,6 +269,7 @@ bool DeckLinkOutput::stopOutput()
 
 void DeckLinkOutput::cleanup()
 {
+    std::lock_guard<std::recursive_mutex> lock(m_deviceMutex);
     stopOutput();
 
     if (m_deckLinkConfiguration) {
@@ -282,6 +290,7 @@ void DeckLinkOutput::cleanup()
 
 void DeckLinkOutput::setHdrMetadata(Gamut colorimetry, Eotf eotf)
 {
+    std::lock_guard<std::recursive_mutex> lock(m_deviceMutex);
     m_useHdrMetadata = true;
     m_hdrColorimetry = colorimetry;
     m_hdrEotf = eotf;
@@ -336,6 +345,7 @@ void DeckLinkOutput::setHdrMetadata(Gamut colorimetry, Eotf eotf)
 
 void DeckLinkOutput::setHdrMetadataCustom(Gamut colorimetry, Eotf eotf, const HdrMetadataCustom& custom)
 {
+    std::lock_guard<std::recursive_mutex> lock(m_deviceMutex);
     m_useHdrMetadata = true;
     m_hdrColorimetry = colorimetry;
     m_hdrEotf = eotf;
@@ -344,6 +354,7 @@ void DeckLinkOutput::setHdrMetadataCustom(Gamut colorimetry, Eotf eotf, const Hd
 
 void DeckLinkOutput::clearHdrMetadata()
 {
+    std::lock_guard<std::recursive_mutex> lock(m_deviceMutex);
     m_useHdrMetadata = false;
     m_hdrColorimetry = Gamut::Rec709;
     m_hdrEotf = Eotf::SDR;
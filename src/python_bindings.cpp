@@ -2,6 +2,7 @@
 #include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 #include "decklink_wrapper.hpp"
+#include <vector>
 
 // Windows doesn't have ssize_t, but pybind11/numpy uses it for strides
 #ifdef _WIN32
@@ -11,12 +12,136 @@
 
 namespace py = pybind11;
 
-std::pair<const uint8_t*, size_t> numpy_to_raw(py::array_t<uint8_t> input) {
+// c_style | forcecast: contiguous uint8 arrays are used in place; anything
+// else (strided views, other dtypes) is converted to a contiguous copy first
+using contiguous_uint8_array = py::array_t<uint8_t, py::array::c_style | py::array::forcecast>;
+
+std::pair<const uint8_t*, size_t> numpy_to_raw(const contiguous_uint8_array& input) {
     py::buffer_info buf_info = input.request();
     return std::make_pair(static_cast<const uint8_t*>(buf_info.ptr), buf_info.size);
 }
 
-py::array_t<uint8_t> rgb_to_bgra(py::array_t<uint8_t> rgb_array, int width, int height) {
+// Output buffer for the conversion functions: the caller's preallocated array
+// when out= is given (reused as-is, so steady-state output allocates nothing),
+// otherwise a freshly allocated one. The conversion functions get their input
+// and output buffers with the GIL held, then release it for the pixel loop,
+// which touches only raw buffers, so other Python threads can run
+static py::array_t<uint8_t> output_array(const py::object& out, const std::vector<ssize_t>& shape) {
+    if (out.is_none()) {
+        return py::array_t<uint8_t>(shape);
+    }
+
+    if (!py::isinstance<py::array_t<uint8_t>>(out)) {
+        throw std::runtime_error("out must be a uint8 numpy array");
+    }
+    auto result = py::reinterpret_borrow<py::array_t<uint8_t>>(out);
+
+    ssize_t size = 1;
+    for (ssize_t dim : shape) {
+        size *= dim;
+    }
+    if (result.size() != size) {
+        throw std::runtime_error("out array size doesn't match the converted frame size");
+    }
+    if (!(result.flags() & py::array::c_style) || !result.writeable()) {
+        throw std::runtime_error("out array must be writable and C-contiguous");
+    }
+    if (reinterpret_cast<uintptr_t>(result.data()) % alignof(uint32_t) != 0) {
+        throw std::runtime_error("out array must be 4-byte aligned");
+    }
+    return result;
+}
+
+// Read one channel of an HxWx3 pixel, honouring the array's channel stride so
+// channel-strided views (e.g. BGR->RGB via [..., ::-1], or planar data
+// transposed to HxWx3) are read correctly without an interleaving copy
+template <typename T>
+static inline T read_channel(const uint8_t* pixel, ssize_t stride_c, int channel) {
+    return *reinterpret_cast<const T*>(pixel + channel * stride_c);
+}
+
+// Normalised float value of every uint16 input code, computed with exactly the
+// (v - (64 << 6)) / (876 << 6) or v / 65535 expressions the kernels used per
+// channel, so lookups give bit-identical results without three divides per pixel.
+// Built once on first use (thread-safe static initialisation)
+static const float* uint16_to_float_table(bool narrow_range) {
+    static const std::vector<float> full_range = [] {
+        std::vector<float> table(65536);
+        for (int v = 0; v < 65536; v++) {
+            table[v] = v / 65535.0f;
+        }
+        return table;
+    }();
+    static const std::vector<float> narrow = [] {
+        std::vector<float> table(65536);
+        for (int v = 0; v < 65536; v++) {
+            table[v] = (v - (64 << 6)) / (float)(876 << 6);
+        }
+        return table;
+    }();
+    return narrow_range ? narrow.data() : full_range.data();
+}
+
+// Output code for every uint16 input code when input and output ranges differ,
+// through the normalised float table: scale/offset give the output range and
+// max_code clamps it. Output range is always the opposite of input_narrow_range
+static std::vector<uint16_t> build_range_remap(bool input_narrow_range, float scale, float offset, int max_code) {
+    const float* to_float = uint16_to_float_table(input_narrow_range);
+    std::vector<uint16_t> table(65536);
+    for (int v = 0; v < 65536; v++) {
+        int code = (int)(to_float[v] * scale + offset);
+        table[v] = (uint16_t)(code < 0 ? 0 : (code > max_code ? max_code : code));
+    }
+    return table;
+}
+
+// Mixed-range uint16 -> 10-bit R'G'B' codes, built once on first use
+// (narrow 16-bit input: 64-940 @ 10-bit = 4096-60160 @ 16-bit)
+static const uint16_t* uint16_to_rgb10_remap(bool input_narrow_range) {
+    // Full input to narrow 10-bit output: 64-940
+    static const std::vector<uint16_t> full_to_narrow = build_range_remap(false, 876.0f, 64.0f, 1023);
+    // Narrow input to full 10-bit output: 0-1023
+    static const std::vector<uint16_t> narrow_to_full = build_range_remap(true, 1023.0f, 0.0f, 1023);
+    return input_narrow_range ? narrow_to_full.data() : full_to_narrow.data();
+}
+
+// Mixed-range uint16 -> 12-bit R'G'B' codes, built once on first use
+// (narrow 16-bit input: 4096-60160, full: 0-65535)
+static const uint16_t* uint16_to_rgb12_remap(bool input_narrow_range) {
+    // Full input to narrow 12-bit output: 256-3760
+    static const std::vector<uint16_t> full_to_narrow = build_range_remap(false, 3504.0f, 256.0f, 4095);
+    // Narrow input to full 12-bit output: 0-4095
+    static const std::vector<uint16_t> narrow_to_full = build_range_remap(true, 4095.0f, 0.0f, 4095);
+    return input_narrow_range ? narrow_to_full.data() : full_to_narrow.data();
+}
+
+// R'G'B' to Y'CbCr matrix coefficients, resolved once per conversion call
+// rather than per pixel
+struct YCbCrCoefficients {
+    float yr, yg, yb;
+    float ur, ug, ub;
+    float vr, vg, vb;
+};
+
+static YCbCrCoefficients ycbcr_coefficients(DeckLinkOutput::Gamut matrix) {
+    switch (matrix) {
+        case DeckLinkOutput::Gamut::Rec601:
+            return {0.299f, 0.587f, 0.114f,
+                    -0.1687f, -0.3313f, 0.5000f,
+                    0.5000f, -0.4187f, -0.0813f};
+        case DeckLinkOutput::Gamut::Rec2020:
+            return {0.2627f, 0.6780f, 0.0593f,
+                    -0.1396f, -0.3604f, 0.5000f,
+                    0.5000f, -0.4598f, -0.0402f};
+        default:
+            // Rec.709 (default)
+            return {0.2126f, 0.7152f, 0.0722f,
+                    -0.1146f, -0.3854f, 0.5000f,
+                    0.5000f, -0.4542f, -0.0458f};
+    }
+}
+
+py::array_t<uint8_t> rgb_to_bgra(contiguous_uint8_array rgb_array, int width, int height, py::object out = py::none()) {
     auto buf = rgb_array.request();
     
     if (buf.ndim != 3 || buf.shape[2] != 3) {
@@ -27,29 +152,90 @@ py::array_t<uint8_t> rgb_to_bgra(py::array_t<uint8_t> rgb_array, int width, int
         throw std::runtime_error("Array dimensions don't match specified width/height");
     }
     
-    auto result = py::array_t<uint8_t>({height, width, 4});
+    auto result = output_array(out, {height, width, 4});
     auto res_buf = result.request();
     
     const uint8_t* src = static_cast<const uint8_t*>(buf.ptr);
-    uint8_t* dst = static_cast<uint8_t*>(res_buf.ptr);
+    uint32_t* dst = static_cast<uint32_t*>(res_buf.ptr);
+    size_t pixel_count = (size_t)width * height;
+
+    py::gil_scoped_release release;
+
+    // Both buffers are contiguous, so treat the frame as one run of pixels and
+    // write each BGRA pixel as a single little-endian 32-bit store (bytes B, G, R, A),
+    // a shape the compiler can turn into byte-shuffle vector code
+    for (size_t i = 0; i < pixel_count; i++) {
+        const uint8_t* pixel = src + i * 3;
+        dst[i] = (uint32_t)pixel[2]                // B
+               | ((uint32_t)pixel[1] << 8)         // G
+               | ((uint32_t)pixel[0] << 16)        // R
+               | 0xFF000000u;                      // A
+    }
     
+    return result;
+}
+
+// 8-bit value of one channel for BGRA output, saturating out-of-range input
+static inline uint8_t to_uint8(uint16_t v) {
+    return (uint8_t)(v >> 8);
+}
+
+static inline uint8_t to_uint8(float v) {
+    // Clamp in float before converting: casting NaN or a value outside int's
+    // range is undefined. v > 0.0f is false for NaN, so NaN becomes 0
+    v = v > 0.0f ? (v < 1.0f ? v : 1.0f) : 0.0f;
+    return (uint8_t)(v * 255.0f);
+}
+
+static inline uint8_t to_uint8(double v) {
+    return to_uint8((float)v);
+}
+
+// uint16 (0-65535) or float (0.0-1.0) RGB to BGRA in one pass, so wider inputs
+// don't need a separate uint8 copy first
+template <typename T>
+py::array_t<uint8_t> rgb_wide_to_bgra(py::array_t<T> rgb_array, int width, int height, py::object out = py::none()) {
+    auto buf = rgb_array.request();
+
+    if (buf.ndim != 3 || buf.shape[2] != 3) {
+        throw std::runtime_error("Input array must be HxWx3 RGB format");
+    }
+
+    if (buf.shape[0] != height || buf.shape[1] != width) {
+        throw std::runtime_error("Array dimensions don't match specified width/height");
+    }
+
+    auto result = output_array(out, {height, width, 4});
+    auto res_buf = result.request();
+
+    const uint8_t* src_base = static_cast<const uint8_t*>(buf.ptr);
+    uint32_t* dst = static_cast<uint32_t*>(res_buf.ptr);
+
+    // Get strides in bytes
+    ssize_t stride_y = buf.strides[0];
+    ssize_t stride_x = buf.strides[1];
+    ssize_t stride_c = buf.strides[2];
+
+    py::gil_scoped_release release;
+
     for (int y = 0; y < height; y++) {
+        const uint8_t* row = src_base + y * stride_y;
+        uint32_t* row_dst = dst + (size_t)y * width;
+
         for (int x = 0; x < width; x++) {
-            int src_idx = y * width * 3 + x * 3;
-            int dst_idx = y * width * 4 + x * 4;
-            
-            // Convert RGB to BGRA
-            dst[dst_idx + 0] = src[src_idx + 2];  // B
-            dst[dst_idx + 1] = src[src_idx + 1];  // G
-            dst[dst_idx + 2] = src[src_idx + 0];  // R
-            dst[dst_idx + 3] = 255;               // A
+            const uint8_t* pixel = row + x * stride_x;
+            // Little-endian 32-bit store: bytes B, G, R, A
+            row_dst[x] = (uint32_t)to_uint8(read_channel<T>(pixel, stride_c, 2))
+                       | ((uint32_t)to_uint8(read_channel<T>(pixel, stride_c, 1)) << 8)
+                       | ((uint32_t)to_uint8(read_channel<T>(pixel, stride_c, 0)) << 16)
+                       | 0xFF000000u;
         }
     }
-    
+
     return result;
 }
 
-py::array_t<uint8_t> rgb_uint16_to_yuv10(py::array_t<uint16_t> rgb_array, int width, int height, DeckLinkOutput::Gamut matrix = DeckLinkOutput::Gamut::Rec709, bool input_narrow_range = false, bool output_narrow_range = true) {
+py::array_t<uint8_t> rgb_uint16_to_yuv10(py::array_t<uint16_t> rgb_array, int width, int height, DeckLinkOutput::Gamut matrix = DeckLinkOutput::Gamut::Rec709, bool input_narrow_range = false, bool output_narrow_range = true, py::object out = py::none()) {
     auto buf = rgb_array.request();
 
     if (buf.ndim != 3 || buf.shape[2] != 3) {
@@ -62,7 +248,7 @@ py::array_t<uint8_t> rgb_uint16_to_yuv10(py::array_t<uint16_t> rgb_array, int wi
 
     // v210 format: 6 pixels packed into 4 32-bit words (16 bytes)
     int row_bytes = ((width + 5) / 6) * 16;
-    auto result = py::array_t<uint8_t>(height * row_bytes);
+    auto result = output_array(out, {(ssize_t)height * row_bytes});
     auto res_buf = result.request();
 
     const uint8_t* src_base = static_cast<const uint8_t*>(buf.ptr);
@@ -73,49 +259,42 @@ py::array_t<uint8_t> rgb_uint16_to_yuv10(py::array_t<uint16_t> rgb_array, int wi
     ssize_t stride_x = buf.strides[1];
     ssize_t stride_c = buf.strides[2];
 
+    const YCbCrCoefficients k = ycbcr_coefficients(matrix);
+    const float* to_float = uint16_to_float_table(input_narrow_range);
+
+    py::gil_scoped_release release;
+
     for (int y = 0; y < height; y++) {
+        const uint8_t* row = src_base + y * stride_y;
+
         for (int x = 0; x < width; x += 6) {
             uint16_t y_values[6], u_values[3], v_values[3];
+            float rf[6], gf[6], bf[6];
             float u_temp[6], v_temp[6];
 
-            // Convert RGB to YUV for up to 6 pixels
+            // Load up to 6 pixels; padding past the row end reads as zero
             for (int i = 0; i < 6; i++) {
                 int pixel_x = x + i;
                 if (pixel_x < width) {
-                    const uint16_t* pixel = reinterpret_cast<const uint16_t*>(
-                        src_base + y * stride_y + pixel_x * stride_x);
-                    uint16_t r = pixel[0];
-                    uint16_t g = pixel[1];
-                    uint16_t b = pixel[2];
-
-                    float rf, gf, bf;
-                    if (input_narrow_range) {
-                        rf = (r - (64 << 6)) / (float)(876 << 6);
-                        gf = (g - (64 << 6)) / (float)(876 << 6);
-                        bf = (b - (64 << 6)) / (float)(876 << 6);
-                    } else {
-                        rf = r / 65535.0f;
-                        gf = g / 65535.0f;
-                        bf = b / 65535.0f;
-                    }
+                    const uint8_t* pixel = row + pixel_x * stride_x;
+                    uint16_t r = read_channel<uint16_t>(pixel, stride_c, 0);
+                    uint16_t g = read_channel<uint16_t>(pixel, stride_c, 1);
+                    uint16_t b = read_channel<uint16_t>(pixel, stride_c, 2);
+
+                    rf[i] = to_float[r];
+                    gf[i] = to_float[g];
+                    bf[i] = to_float[b];
+                } else {
+                    rf[i] = gf[i] = bf[i] = 0.0f;
+                }
+            }
 
-                    float yf, uf, vf;
-                    if (matrix == DeckLinkOutput::Gamut::Rec601) {
-                        // Rec.601 coefficients
-                        yf = 0.299f * rf + 0.587f * gf + 0.114f * bf;
-                        uf = -0.1687f * rf - 0.3313f * gf + 0.5000f * bf;
-                        vf = 0.5000f * rf - 0.4187f * gf - 0.0813f * bf;
-                    } else if (matrix == DeckLinkOutput::Gamut::Rec2020) {
-                        // Rec.2020 coefficients
-                        yf = 0.2627f * rf + 0.6780f * gf + 0.0593f * bf;
-                        uf = -0.1396f * rf - 0.3604f * gf + 0.5000f * bf;
-                        vf = 0.5000f * rf - 0.4598f * gf - 0.0402f * bf;
-                    } else {
-                        // Rec.709 coefficients (default)
-                        yf = 0.2126f * rf + 0.7152f * gf + 0.0722f * bf;
-                        uf = -0.1146f * rf - 0.3854f * gf + 0.5000f * bf;
-                        vf = 0.5000f * rf - 0.4542f * gf - 0.0458f * bf;
-                    }
+            // Y'CbCr per pixel
+            for (int i = 0; i < 6; i++) {
+                if (x + i < width) {
+                    float yf = k.yr * rf[i] + k.yg * gf[i] + k.yb * bf[i];
+                    u_temp[i] = k.ur * rf[i] + k.ug * gf[i] + k.ub * bf[i];
+                    v_temp[i] = k.vr * rf[i] + k.vg * gf[i] + k.vb * bf[i];
 
                     int y10;
                     if (output_narrow_range) {
@@ -124,8 +303,6 @@ py::array_t<uint8_t> rgb_uint16_to_yuv10(py::array_t<uint16_t> rgb_array, int wi
                         y10 = (int)(yf * 1023.0f);
                     }
                     y_values[i] = (uint16_t)(y10 < 0 ? 0 : (y10 > 1023 ? 1023 : y10));
-                    u_temp[i] = uf;
-                    v_temp[i] = vf;
                 } else {
                     y_values[i] = output_narrow_range ? 64 : 0;
                     u_temp[i] = 0.0f;
@@ -164,7 +341,8 @@ py::array_t<uint8_t> rgb_uint16_to_yuv10(py::array_t<uint16_t> rgb_array, int wi
     return result;
 }
 
-py::array_t<uint8_t> rgb_float_to_yuv10(py::array_t<float> rgb_array, int width, int height, DeckLinkOutput::Gamut matrix = DeckLinkOutput::Gamut::Rec709, bool output_narrow_range = true) {
+template <typename T>
+py::array_t<uint8_t> rgb_float_to_yuv10(py::array_t<T> rgb_array, int width, int height, DeckLinkOutput::Gamut matrix = DeckLinkOutput::Gamut::Rec709, bool output_narrow_range = true, py::object out = py::none()) {
     auto buf = rgb_array.request();
 
     if (buf.ndim != 3 || buf.shape[2] != 3) {
@@ -177,7 +355,7 @@ py::array_t<uint8_t> rgb_float_to_yuv10(py::array_t<float> rgb_array, int width,
 
     // v210 format: 6 pixels packed into 4 32-bit words (16 bytes)
     int row_bytes = ((width + 5) / 6) * 16;
-    auto result = py::array_t<uint8_t>(height * row_bytes);
+    auto result = output_array(out, {(ssize_t)height * row_bytes});
     auto res_buf = result.request();
 
     const uint8_t* src_base = static_cast<const uint8_t*>(buf.ptr);
@@ -188,39 +366,37 @@ py::array_t<uint8_t> rgb_float_to_yuv10(py::array_t<float> rgb_array, int width,
     ssize_t stride_x = buf.strides[1];
     ssize_t stride_c = buf.strides[2];
 
+    const YCbCrCoefficients k = ycbcr_coefficients(matrix);
+
+    py::gil_scoped_release release;
 
     for (int y = 0; y < height; y++) {
+        const uint8_t* row = src_base + y * stride_y;
+
         for (int x = 0; x < width; x += 6) {
             uint16_t y_values[6], u_values[3], v_values[3];
+            float rf[6], gf[6], bf[6];
             float u_temp[6], v_temp[6];
 
-            // Convert RGB to YUV for up to 6 pixels
+            // Load up to 6 pixels; padding past the row end reads as zero
             for (int i = 0; i < 6; i++) {
                 int pixel_x = x + i;
                 if (pixel_x < width) {
-                    const float* pixel = reinterpret_cast<const float*>(
-                        src_base + y * stride_y + pixel_x * stride_x);
-                    float r = pixel[0];
-                    float g = pixel[1];
-                    float b = pixel[2];
-
-                    float yf, uf, vf;
-                    if (matrix == DeckLinkOutput::Gamut::Rec601) {
-                        // Rec.601 coefficients
-                        yf = 0.299f * r + 0.587f * g + 0.114f * b;
-                        uf = -0.1687f * r - 0.3313f * g + 0.5000f * b;
-                        vf = 0.5000f * r - 0.4187f * g - 0.0813f * b;
-                    } else if (matrix == DeckLinkOutput::Gamut::Rec2020) {
-                        // Rec.2020 coefficients
-                        yf = 0.2627f * r + 0.6780f * g + 0.0593f * b;
-                        uf = -0.1396f * r - 0.3604f * g + 0.5000f * b;
-                        vf = 0.5000f * r - 0.4598f * g - 0.0402f * b;
-                    } else {
-                        // Rec.709 coefficients (default)
-                        yf = 0.2126f * r + 0.7152f * g + 0.0722f * b;
-                        uf = -0.1146f * r - 0.3854f * g + 0.5000f * b;
-                        vf = 0.5000f * r - 0.4542f * g - 0.0458f * b;
-                    }
+                    const uint8_t* pixel = row + pixel_x * stride_x;
+                    rf[i] = read_channel<T>(pixel, stride_c, 0);
+                    gf[i] = read_channel<T>(pixel, stride_c, 1);
+                    bf[i] = read_channel<T>(pixel, stride_c, 2);
+                } else {
+                    rf[i] = gf[i] = bf[i] = 0.0f;
+                }
+            }
+
+            // Y'CbCr per pixel
+            for (int i = 0; i < 6; i++) {
+                if (x + i < width) {
+                    float yf = k.yr * rf[i] + k.yg * gf[i] + k.yb * bf[i];
+                    u_temp[i] = k.ur * rf[i] + k.ug * gf[i] + k.ub * bf[i];
+                    v_temp[i] = k.vr * rf[i] + k.vg * gf[i] + k.vb * bf[i];
 
                     int y10;
                     if (output_narrow_range) {
@@ -229,8 +405,6 @@ py::array_t<uint8_t> rgb_float_to_yuv10(py::array_t<float> rgb_array, int width,
                         y10 = (int)(yf * 1023.0f);
                     }
                     y_values[i] = (uint16_t)(y10 < 0 ? 0 : (y10 > 1023 ? 1023 : y10));
-                    u_temp[i] = uf;
-                    v_temp[i] = vf;
                 } else {
                     y_values[i] = output_narrow_range ? 64 : 0;
                     u_temp[i] = 0.0f;
@@ -269,7 +443,7 @@ py::array_t<uint8_t> rgb_float_to_yuv10(py::array_t<float> rgb_array, int width,
     return result;
 }
 
-py::array_t<uint8_t> rgb_uint16_to_rgb10(py::array_t<uint16_t> rgb_array, int width, int height, bool input_narrow_range = true, bool output_narrow_range = true) {
+py::array_t<uint8_t> rgb_uint16_to_rgb10(py::array_t<uint16_t> rgb_array, int width, int height, bool input_narrow_range = true, bool output_narrow_range = true, py::object out = py::none()) {
     auto buf = rgb_array.request();
 
     if (buf.ndim != 3 || buf.shape[2] != 3) {
@@ -282,7 +456,7 @@ py::array_t<uint8_t> rgb_uint16_to_rgb10(py::array_t<uint16_t> rgb_array, int wi
 
     // bmdFormat10BitRGBXLE: 4 bytes per pixel (32-bit words)
     int row_bytes = width * 4;
-    auto result = py::array_t<uint8_t>(height * row_bytes);
+    auto result = output_array(out, {(ssize_t)height * row_bytes});
     auto res_buf = result.request();
 
     const uint8_t* src_base = static_cast<const uint8_t*>(buf.ptr);
@@ -291,52 +465,35 @@ py::array_t<uint8_t> rgb_uint16_to_rgb10(py::array_t<uint16_t> rgb_array, int wi
     // Get strides in bytes
     ssize_t stride_y = buf.strides[0];
     ssize_t stride_x = buf.strides[1];
+    ssize_t stride_c = buf.strides[2];
+
+    // Different ranges: one table lookup per channel maps the input code to
+    // its 10-bit output code
+    const uint16_t* remap = input_narrow_range != output_narrow_range
+        ? uint16_to_rgb10_remap(input_narrow_range) : nullptr;
+
+    py::gil_scoped_release release;
 
     for (int y = 0; y < height; y++) {
         uint32_t* row_dst = dst + (y * row_bytes / 4);
         for (int x = 0; x < width; x++) {
-            const uint16_t* pixel = reinterpret_cast<const uint16_t*>(
-                src_base + y * stride_y + x * stride_x);
+            const uint8_t* pixel = src_base + y * stride_y + x * stride_x;
+            uint16_t r_in = read_channel<uint16_t>(pixel, stride_c, 0);
+            uint16_t g_in = read_channel<uint16_t>(pixel, stride_c, 1);
+            uint16_t b_in = read_channel<uint16_t>(pixel, stride_c, 2);
 
             uint16_t r10, g10, b10;
 
             if (input_narrow_range == output_narrow_range) {
                 // Same range: simple bit-shift
-                r10 = pixel[0] >> 6;
-                g10 = pixel[1] >> 6;
-                b10 = pixel[2] >> 6;
+                r10 = r_in >> 6;
+                g10 = g_in >> 6;
+                b10 = b_in >> 6;
             } else {
-                // Different ranges: convert through normalized float
-                float rf, gf, bf;
-                if (input_narrow_range) {
-                    // Narrow 16-bit input: 64-940 @ 10-bit = 4096-60160 @ 16-bit
-                    rf = (pixel[0] - (64 << 6)) / (float)(876 << 6);
-                    gf = (pixel[1] - (64 << 6)) / (float)(876 << 6);
-                    bf = (pixel[2] - (64 << 6)) / (float)(876 << 6);
-                } else {
-                    // Full 16-bit input: 0-65535
-                    rf = pixel[0] / 65535.0f;
-                    gf = pixel[1] / 65535.0f;
-                    bf = pixel[2] / 65535.0f;
-                }
-
-                int r10_int, g10_int, b10_int;
-                if (output_narrow_range) {
-                    // Narrow 10-bit output: 64-940
-                    r10_int = (int)(rf * 876.0f + 64.0f);
-                    g10_int = (int)(gf * 876.0f + 64.0f);
-                    b10_int = (int)(bf * 876.0f + 64.0f);
-                } else {
-                    // Full 10-bit output: 0-1023
-                    r10_int = (int)(rf * 1023.0f);
-                    g10_int = (int)(gf * 1023.0f);
-                    b10_int = (int)(bf * 1023.0f);
-                }
-
-                // Clamp to valid 10-bit range before packing
-                r10 = (uint16_t)(r10_int < 0 ? 0 : (r10_int > 1023 ? 1023 : r10_int));
-                g10 = (uint16_t)(g10_int < 0 ? 0 : (g10_int > 1023 ? 1023 : g10_int));
-                b10 = (uint16_t)(b10_int < 0 ? 0 : (b10_int > 1023 ? 1023 : b10_int));
+                // Different ranges: precomputed remap
+                r10 = remap[r_in];
+                g10 = remap[g_in];
+                b10 = remap[b_in];
             }
 
             // Pack as bmdFormat10BitRGBXLE (little-endian 10-bit RGB)
@@ -348,7 +505,8 @@ py::array_t<uint8_t> rgb_uint16_to_rgb10(py::array_t<uint16_t> rgb_array, int wi
     return result;
 }
 
-py::array_t<uint8_t> rgb_float_to_rgb10(py::array_t<float> rgb_array, int width, int height, bool output_narrow_range = true) {
+template <typename T>
+py::array_t<uint8_t> rgb_float_to_rgb10(py::array_t<T> rgb_array, int width, int height, bool output_narrow_range = true, py::object out = py::none()) {
     auto buf = rgb_array.request();
 
     if (buf.ndim != 3 || buf.shape[2] != 3) {
@@ -361,7 +519,7 @@ py::array_t<uint8_t> rgb_float_to_rgb10(py::array_t<float> rgb_array, int width,
 
     // bmdFormat10BitRGBXLE: 4 bytes per pixel (32-bit words)
     int row_bytes = width * 4;
-    auto result = py::array_t<uint8_t>(height * row_bytes);
+    auto result = output_array(out, {(ssize_t)height * row_bytes});
     auto res_buf = result.request();
 
     const uint8_t* src_base = static_cast<const uint8_t*>(buf.ptr);
@@ -370,22 +528,27 @@ py::array_t<uint8_t> rgb_float_to_rgb10(py::array_t<float> rgb_array, int width,
     // Get strides in bytes
     ssize_t stride_y = buf.strides[0];
     ssize_t stride_x = buf.strides[1];
+    ssize_t stride_c = buf.strides[2];
 
     // Narrow range: 0.0-1.0 maps to 64-940 (10-bit)
     // Full range: 0.0-1.0 maps to 0-1023 (10-bit)
     float scale = output_narrow_range ? 876.0f : 1023.0f;
     float offset = output_narrow_range ? 64.0f : 0.0f;
 
+    py::gil_scoped_release release;
+
     for (int y = 0; y < height; y++) {
         uint32_t* row_dst = dst + (y * row_bytes / 4);
         for (int x = 0; x < width; x++) {
-            const float* pixel = reinterpret_cast<const float*>(
-                src_base + y * stride_y + x * stride_x);
+            const uint8_t* pixel = src_base + y * stride_y + x * stride_x;
+            float r_in = read_channel<T>(pixel, stride_c, 0);
+            float g_in = read_channel<T>(pixel, stride_c, 1);
+            float b_in = read_channel<T>(pixel, stride_c, 2);
 
             // Convert float (0.0-1.0) to 10-bit with clamping
-            int r10 = (int)(pixel[0] * scale + offset);
-            int g10 = (int)(pixel[1] * scale + offset);
-            int b10 = (int)(pixel[2] * scale + offset);
+            int r10 = (int)(r_in * scale + offset);
+            int g10 = (int)(g_in * scale + offset);
+            int b10 = (int)(b_in * scale + offset);
 
             // Clamp to valid range
             r10 = r10 < 0 ? 0 : (r10 > 1023 ? 1023 : r10);
@@ -401,7 +564,8 @@ py::array_t<uint8_t> rgb_float_to_rgb10(py::array_t<float> rgb_array, int width,
 }
 
 py::array_t<uint8_t> rgb_uint16_to_rgb12(py::array_t<uint16_t> rgb_array, int width, int height,
-                                         bool input_narrow_range = false, bool output_narrow_range = false) {
+                                         bool input_narrow_range = false, bool output_narrow_range = false,
+                                         py::object out = py::none()) {
     auto buf = rgb_array.request();
 
     if (buf.ndim != 3 || buf.shape[2] != 3) {
@@ -414,7 +578,7 @@ py::array_t<uint8_t> rgb_uint16_to_rgb12(py::array_t<uint16_t> rgb_array, int wi
 
     // bmdFormat12BitRGBLE: 36 bits per pixel, 8 pixels in 36 bytes (9 DWORDs)
     int row_bytes = ((width + 7) / 8) * 36;
-    auto result = py::array_t<uint8_t>(height * row_bytes);
+    auto result = output_array(out, {(ssize_t)height * row_bytes});
     auto res_buf = result.request();
 
     const uint8_t* src_base = static_cast<const uint8_t*>(buf.ptr);
@@ -423,10 +587,17 @@ py::array_t<uint8_t> rgb_uint16_to_rgb12(py::array_t<uint16_t> rgb_array, int wi
     // Get strides in bytes
     ssize_t stride_y = buf.strides[0];
     ssize_t stride_x = buf.strides[1];
+    ssize_t stride_c = buf.strides[2];
 
     // Optimize: use bit-shift when input and output ranges match
     bool use_bitshift = (input_narrow_range == output_narrow_range);
 
+    // Otherwise one table lookup per channel maps the input code to its
+    // 12-bit output code
+    const uint16_t* remap = use_bitshift ? nullptr : uint16_to_rgb12_remap(input_narrow_range);
+
+    py::gil_scoped_release release;
+
     for (int y = 0; y < height; y++) {
         uint32_t* nextWord = dst + (y * row_bytes / 4);
 
@@ -437,48 +608,21 @@ py::array_t<uint8_t> rgb_uint16_to_rgb12(py::array_t<uint16_t> rgb_array, int wi
             for (int i = 0; i < 8; i++) {
                 int pixel_x = x + i;
                 if (pixel_x < width) {
-                    const uint16_t* pixel = reinterpret_cast<const uint16_t*>(
-                        src_base + y * stride_y + pixel_x * stride_x);
+                    const uint8_t* pixel = src_base + y * stride_y + pixel_x * stride_x;
+                    uint16_t r_in = read_channel<uint16_t>(pixel, stride_c, 0);
+                    uint16_t g_in = read_channel<uint16_t>(pixel, stride_c, 1);
+                    uint16_t b_in = read_channel<uint16_t>(pixel, stride_c, 2);
 
                     if (use_bitshift) {
                         // Convert 16-bit to 12-bit by right-shifting 4 bits
-                        r[i] = pixel[0] >> 4;
-                        g[i] = pixel[1] >> 4;
-                        b[i] = pixel[2] >> 4;
+                        r[i] = r_in >> 4;
+                        g[i] = g_in >> 4;
+                        b[i] = b_in >> 4;
                     } else {
-                        // Convert through normalized float when ranges differ
-                        float rf, gf, bf;
-
-                        // Input conversion to 0.0-1.0
-                        if (input_narrow_range) {
-                            // Narrow range: 4096-60160 (64-940 @12-bit)
-                            rf = (pixel[0] - (64 << 6)) / (float)(876 << 6);
-                            gf = (pixel[1] - (64 << 6)) / (float)(876 << 6);
-                            bf = (pixel[2] - (64 << 6)) / (float)(876 << 6);
-                        } else {
-                            // Full range: 0-65535
-                            rf = pixel[0] / 65535.0f;
-                            gf = pixel[1] / 65535.0f;
-                            bf = pixel[2] / 65535.0f;
-                        }
-
-                        // Output conversion from 0.0-1.0
-                        int r12, g12, b12;
-                        if (output_narrow_range) {
-                            // Narrow range: 256-3760
-                            r12 = (int)(rf * 3504.0f + 256.0f);
-                            g12 = (int)(gf * 3504.0f + 256.0f);
-                            b12 = (int)(bf * 3504.0f + 256.0f);
-                        } else {
-                            // Full range: 0-4095
-                            r12 = (int)(rf * 4095.0f);
-                            g12 = (int)(gf * 4095.0f);
-                            b12 = (int)(bf * 4095.0f);
-                        }
-                        // Clamp to valid 12-bit range before packing
-                        r[i] = (uint16_t)(r12 < 0 ? 0 : (r12 > 4095 ? 4095 : r12));
-                        g[i] = (uint16_t)(g12 < 0 ? 0 : (g12 > 4095 ? 4095 : g12));
-                        b[i] = (uint16_t)(b12 < 0 ? 0 : (b12 > 4095 ? 4095 : b12));
+                        // Ranges differ: precomputed remap
+                        r[i] = remap[r_in];
+                        g[i] = remap[g_in];
+                        b[i] = remap[b_in];
                     }
                 } else {
                     // Padding for incomplete groups
@@ -504,7 +648,8 @@ py::array_t<uint8_t> rgb_uint16_to_rgb12(py::array_t<uint16_t> rgb_array, int wi
     return result;
 }
 
-py::array_t<uint8_t> rgb_float_to_rgb12(py::array_t<float> rgb_array, int width, int height, bool output_narrow_range = false) {
+template <typename T>
+py::array_t<uint8_t> rgb_float_to_rgb12(py::array_t<T> rgb_array, int width, int height, bool output_narrow_range = false, py::object out = py::none()) {
     auto buf = rgb_array.request();
 
     if (buf.ndim != 3 || buf.shape[2] != 3) {
@@ -517,7 +662,7 @@ py::array_t<uint8_t> rgb_float_to_rgb12(py::array_t<float> rgb_array, int width,
 
     // bmdFormat12BitRGBLE: 36 bits per pixel, 8 pixels in 36 bytes (9 DWORDs)
     int row_bytes = ((width + 7) / 8) * 36;
-    auto result = py::array_t<uint8_t>(height * row_bytes);
+    auto result = output_array(out, {(ssize_t)height * row_bytes});
     auto res_buf = result.request();
 
     const uint8_t* src_base = static_cast<const uint8_t*>(buf.ptr);
@@ -526,12 +671,15 @@ py::array_t<uint8_t> rgb_float_to_rgb12(py::array_t<float> rgb_array, int width,
     // Get strides in bytes
     ssize_t stride_y = buf.strides[0];
     ssize_t stride_x = buf.strides[1];
+    ssize_t stride_c = buf.strides[2];
 
     // Narrow range: 0.0-1.0 maps to 256-3760 (12-bit)
     // Full range: 0.0-1.0 maps to 0-4095 (12-bit)
     float scale = output_narrow_range ? 3504.0f : 4095.0f;
     float offset = output_narrow_range ? 256.0f : 0.0f;
 
+    py::gil_scoped_release release;
+
     for (int y = 0; y < height; y++) {
         uint32_t* nextWord = dst + (y * row_bytes / 4);
 
@@ -542,13 +690,15 @@ py::array_t<uint8_t> rgb_float_to_rgb12(py::array_t<float> rgb_array, int width,
             for (int i = 0; i < 8; i++) {
                 int pixel_x = x + i;
                 if (pixel_x < width) {
-                    const float* pixel = reinterpret_cast<const float*>(
-                        src_base + y * stride_y + pixel_x * stride_x);
+                    const uint8_t* pixel = src_base + y * stride_y + pixel_x * stride_x;
+                    float r_in = read_channel<T>(pixel, stride_c, 0);
+                    float g_in = read_channel<T>(pixel, stride_c, 1);
+                    float b_in = read_channel<T>(pixel, stride_c, 2);
 
                     // Convert float (0.0-1.0) to 12-bit with clamping
-                    int r12 = (int)(pixel[0] * scale + offset);
-                    int g12 = (int)(pixel[1] * scale + offset);
-                    int b12 = (int)(pixel[2] * scale + offset);
+                    int r12 = (int)(r_in * scale + offset);
+                    int g12 = (int)(g_in * scale + offset);
+                    int b12 = (int)(b_in * scale + offset);
 
                     // Clamp to valid range
                     r[i] = (uint16_t)(r12 < 0 ? 0 : (r12 > 4095 ? 4095 : r12));
@@ -789,11 +939,15 @@ PYBIND11_MODULE(decklink_output, m) {
              "Initialize DeckLink device", py::arg("device_index") = 0)
         .def("setup_output", &DeckLinkOutput::setupOutput,
              "Setup video output with specified settings")
-        .def("set_frame_data", [](DeckLinkOutput& self, py::array_t<uint8_t> data) {
+        .def("set_frame_data", [](DeckLinkOutput& self, contiguous_uint8_array data) {
             auto [ptr, size] = numpy_to_raw(data);
+            // data keeps the buffer alive; the copy into the frame buffer doesn't need the GIL
+            py::gil_scoped_release release;
             return self.setFrameData(ptr, size);
         }, "Set frame data from numpy array")
-        .def("display_frame", &DeckLinkOutput::displayFrame, "Display the current frame synchronously")
+        .def("display_frame", &DeckLinkOutput::displayFrame,
+             "Display the current frame synchronously (releases the GIL while the frame is output)",
+             py::call_guard<py::gil_scoped_release>())
         .def("stop_output", &DeckLinkOutput::stopOutput, "Stop video output")
         .def("cleanup", &DeckLinkOutput::cleanup, "Cleanup resources")
         .def("get_device_list", &DeckLinkOutput::getDeviceList, "Get list of available devices")
@@ -812,41 +966,82 @@ PYBIND11_MODULE(decklink_output, m) {
     // Utility functions
     m.def("rgb_to_bgra", &rgb_to_bgra,
           "Convert RGB numpy array to BGRA format",
-          py::arg("rgb_array"), py::arg("width"), py::arg("height"));
+          py::arg("rgb_array"), py::arg("width"), py::arg("height"),
+          py::arg("out") = py::none());
+
+    m.def("rgb_uint16_to_bgra", &rgb_wide_to_bgra<uint16_t>,
+          "Convert RGB uint16 numpy array to 8-bit BGRA format",
+          py::arg("rgb_array"), py::arg("width"), py::arg("height"),
+          py::arg("out") = py::none());
+
+    m.def("rgb_float_to_bgra", &rgb_wide_to_bgra<float>,
+          "Convert RGB float numpy array to 8-bit BGRA format",
+          py::arg("rgb_array"), py::arg("width"), py::arg("height"),
+          py::arg("out") = py::none());
+
+    m.def("rgb_float_to_bgra", &rgb_wide_to_bgra<double>,
+          "Convert RGB float numpy array to 8-bit BGRA format (float64 input, narrowed to float32 per pixel)",
+          py::arg("rgb_array"), py::arg("width"), py::arg("height"),
+          py::arg("out") = py::none());
 
     m.def("rgb_uint16_to_yuv10", &rgb_uint16_to_yuv10,
           "Convert RGB uint16 numpy array to 10-bit YUV v210 format",
           py::arg("rgb_array"), py::arg("width"), py::arg("height"),
           py::arg("matrix") = DeckLinkOutput::Gamut::Rec709,
           py::arg("input_narrow_range") = false,
-          py::arg("output_narrow_range") = true);
+          py::arg("output_narrow_range") = true,
+          py::arg("out") = py::none());
 
-    m.def("rgb_float_to_yuv10", &rgb_float_to_yuv10,
+    m.def("rgb_float_to_yuv10", &rgb_float_to_yuv10<float>,
           "Convert RGB float numpy array to 10-bit YUV v210 format",
           py::arg("rgb_array"), py::arg("width"), py::arg("height"),
           py::arg("matrix") = DeckLinkOutput::Gamut::Rec709,
-          py::arg("output_narrow_range") = true);
+          py::arg("output_narrow_range") = true,
+          py::arg("out") = py::none());
+
+    m.def("rgb_float_to_yuv10", &rgb_float_to_yuv10<double>,
+          "Convert RGB float numpy array to 10-bit YUV v210 format (float64 input, narrowed to float32 per pixel)",
+          py::arg("rgb_array"), py::arg("width"), py::arg("height"),
+          py::arg("matrix") = DeckLinkOutput::Gamut::Rec709,
+          py::arg("output_narrow_range") = true,
+          py::arg("out") = py::none());
 
     m.def("rgb_uint16_to_rgb10", &rgb_uint16_to_rgb10,
           "Convert RGB uint16 numpy array to 10-bit RGB r210 format",
           py::arg("rgb_array"), py::arg("width"), py::arg("height"),
           py::arg("input_narrow_range") = true,
-          py::arg("output_narrow_range") = true);
+          py::arg("output_narrow_range") = true,
+          py::arg("out") = py::none());
 
-    m.def("rgb_float_to_rgb10", &rgb_float_to_rgb10,
+    m.def("rgb_float_to_rgb10", &rgb_float_to_rgb10<float>,
           "Convert RGB float numpy array to 10-bit RGB r210 format",
           py::arg("rgb_array"), py::arg("width"), py::arg("height"),
-          py::arg("output_narrow_range") = true);
+          py::arg("output_narrow_range") = true,
+          py::arg("out") = py::none());
+
+    m.def("rgb_float_to_rgb10", &rgb_float_to_rgb10<double>,
+          "Convert RGB float numpy array to 10-bit RGB r210 format (float64 input, narrowed to float32 per pixel)",
+          py::arg("rgb_array"), py::arg("width"), py::arg("height"),
+          py::arg("output_narrow_range") = true,
+          py::arg("out") = py::none());
 
     m.def("rgb_uint16_to_rgb12", &rgb_uint16_to_rgb12,
           "Convert RGB uint16 numpy array to 12-bit RGB format",
           py::arg("rgb_array"), py::arg("width"), py::arg("height"),
-          py::arg("input_narrow_range") = false, py::arg("output_narrow_range") = false);
+          py::arg("input_narrow_range") = false, py::arg("output_narrow_range") = false,
+          py::arg("out") = py::none());
 
-    m.def("rgb_float_to_rgb12", &rgb_float_to_rgb12,
+    m.def("rgb_float_to_rgb12", &rgb_float_to_rgb12<float>,
           "Convert RGB float numpy array to 12-bit RGB format",
           py::arg("rgb_array"), py::arg("width"), py::arg("height"),
-          py::arg("output_narrow_range") = false);
+          py::arg("output_narrow_range") = false,
+          py::arg("out") = py::none());
+
+    m.def("rgb_float_to_rgb12", &rgb_float_to_rgb12<double>,
+          "Convert RGB float numpy array to 12-bit RGB format (float64 input, narrowed to float32 per pixel)",
+          py::arg("rgb_array"), py::arg("width"), py::arg("height"),
+          py::arg("output_narrow_range") = false,
+          py::arg("out") = py::none());
 
     // Version info
     m.attr("__version__") = "0.15.0b0";
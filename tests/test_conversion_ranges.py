@@ -9,7 +9,7 @@ import numpy as np
 import pytest
 
 try:
-    from blackmagic_output import rgb_uint16_to_yuv10, rgb_float_to_yuv10, Gamut
+    from blackmagic_output import rgb_uint16_to_yuv10, rgb_uint16_planes_to_yuv10, rgb_float_to_yuv10, Gamut
     CONVERSIONS_AVAILABLE = True
 except ImportError:
     CONVERSIONS_AVAILABLE = False
@@ -254,6 +254,54 @@ class TestRGBtoYUVConversions:
         assert cb == 512, f"Expected Cb=512 for black, got {cb}"
         assert cr == 512, f"Expected Cr=512 for black, got {cr}"
 
+    def test_dimensions_default_to_array_shape(self):
+        """Test width/height are taken from the array shape when omitted."""
+        width, height = 12, 2
+        rgb = np.random.default_rng(0).random((height, width, 3), dtype=np.float32)
+
+        explicit = rgb_float_to_yuv10(rgb, width, height, Gamut.Rec709)
+        inferred = rgb_float_to_yuv10(rgb, matrix=Gamut.Rec709)
+
+        assert np.array_equal(explicit, inferred)
+
+        with pytest.raises(RuntimeError, match="HxWx3"):
+            rgb_float_to_yuv10(np.zeros(12, dtype=np.float32))
+
+    def test_out_buffer_is_filled_and_returned(self):
+        """Test conversion into a caller-provided output buffer."""
+        width, height = 12, 2
+        rgb = np.random.default_rng(0).random((height, width, 3), dtype=np.float32)
+
+        expected = rgb_float_to_yuv10(rgb, width, height, Gamut.Rec709)
+        out = np.zeros_like(expected)
+        result = rgb_float_to_yuv10(rgb, width, height, Gamut.Rec709, out=out)
+
+        assert np.shares_memory(result, out)
+        assert np.array_equal(out, expected)
+
+        with pytest.raises(RuntimeError):
+            rgb_float_to_yuv10(rgb, width, height, Gamut.Rec709, out=out[:-4])
+
+    def test_planar_input_matches_interleaved(self):
+        """Test 3xHxW planar input gives the same v210 as the HxWx3 equivalent."""
+        width, height = 12, 2
+        planes = np.random.default_rng(0).integers(0, 65536, (3, height, width), dtype=np.uint16)
+
+        expected = rgb_uint16_to_yuv10(np.ascontiguousarray(planes.transpose(1, 2, 0)), width, height)
+
+        assert np.array_equal(rgb_uint16_planes_to_yuv10(planes), expected)
+
+    def test_planar_input_rejects_other_types(self):
+        """Test planar input must be a uint16 3xHxW array rather than being cast or stacked."""
+        planes = np.zeros((3, 2, 12), dtype=np.uint16)
+
+        with pytest.raises(TypeError):
+            rgb_uint16_planes_to_yuv10(list(planes))
+        with pytest.raises(TypeError):
+            rgb_uint16_planes_to_yuv10(planes.astype(np.float32))
+        with pytest.raises(ValueError):
+            rgb_uint16_planes_to_yuv10(planes[:2])
+
 
 @pytest.mark.skipif(not CONVERSIONS_AVAILABLE, reason="Conversion functions not available")
 class TestRGBtoRGB10Conversions:
@@ -508,5 +556,31 @@ class TestRGBtoRGB12Conversions:
         assert b == 3760, f"Expected B=3760 for float narrow white, got {b}"
 
 
+@pytest.mark.skipif(not CONVERSIONS_AVAILABLE, reason="Conversion functions not available")
+class TestRGBtoBGRAConversions:
+    """Test uint16 and float RGB to 8-bit BGRA conversions."""
+
+    def test_wide_input_scales_and_saturates(self):
+        """Test uint16 keeps the top 8 bits and float 0.0-1.0 maps to 0-255, clamped."""
+        from blackmagic_output import rgb_uint16_to_bgra, rgb_float_to_bgra
+
+        rgb16 = np.array([[[65535, 32768, 255]]], dtype=np.uint16)
+        assert rgb_uint16_to_bgra(rgb16)[0, 0].tolist() == [0, 128, 255, 255]
+
+        rgbf = np.array([[[1.5, 0.5, -0.25]]], dtype=np.float32)
+        assert rgb_float_to_bgra(rgbf)[0, 0].tolist() == [0, 127, 255, 255]
+        assert np.array_equal(rgb_float_to_bgra(rgbf.astype(np.float64)), rgb_float_to_bgra(rgbf))
+
+    def test_float_non_finite_and_huge_values_saturate(self):
+        """Test NaN maps to 0, and inf and very large values saturate to 0 or 255."""
+        from blackmagic_output import rgb_float_to_bgra
+
+        rgbf = np.array([[[np.nan, np.inf, 1e10], [-np.inf, -1e10, 0.0]]], dtype=np.float32)
+        bgra = rgb_float_to_bgra(rgbf)
+
+        assert bgra[0, 0].tolist() == [255, 255, 0, 255]
+        assert bgra[0, 1].tolist() == [0, 0, 0, 255]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
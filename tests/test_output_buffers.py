@@ -0,0 +1,173 @@
+"""
+Test BlackmagicOutput's reuse of conversion output buffers and its per-mode
+video settings cache.
+
+The DeckLink device is mocked, so these tests run without hardware. The real
+conversion functions are used, so converted frames are checked end to end.
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pytest
+
+try:
+    import decklink_output as _decklink
+    from blackmagic_output import BlackmagicOutput, DisplayMode, PixelFormat, rgb_float_to_yuv10
+    CONVERSIONS_AVAILABLE = True
+except ImportError:
+    CONVERSIONS_AVAILABLE = False
+
+
+# Small frame sizes per display mode keep the conversions fast
+MODE_SIZES = {
+    "HD1080p25": (12, 4),
+    "HD720p50": (6, 2),
+}
+
+
+def make_device():
+    """Mock DeckLinkOutput that accepts every call and reports small frame sizes."""
+    device = mock.MagicMock()
+    device.initialize.return_value = True
+    device.setup_output.return_value = True
+    device.set_frame_data.return_value = True
+    device.display_frame.return_value = True
+
+    sizes = {getattr(DisplayMode, name).value: size for name, size in MODE_SIZES.items()}
+
+    def get_video_settings(mode):
+        width, height = sizes[mode]
+        return SimpleNamespace(mode=mode, format=PixelFormat.BGRA.value,
+                               width=width, height=height, framerate=25.0)
+
+    device.get_video_settings.side_effect = get_video_settings
+    return device
+
+
+@pytest.fixture
+def output():
+    """Initialized BlackmagicOutput on a mocked device."""
+    with mock.patch.object(_decklink, "DeckLinkOutput", return_value=make_device()):
+        output = BlackmagicOutput()
+    assert output.initialize()
+    return output
+
+
+def random_frame(mode_name, seed=0):
+    width, height = MODE_SIZES[mode_name]
+    return np.random.default_rng(seed).random((height, width, 3), dtype=np.float32)
+
+
+def sent_frame(output):
+    """The array most recently passed to the device's set_frame_data()."""
+    return output._device.set_frame_data.call_args[0][0]
+
+
+@pytest.mark.skipif(not CONVERSIONS_AVAILABLE, reason="Conversion functions not available")
+class TestOutputBufferReuse:
+    """Test that converted frames reuse one buffer per format and size."""
+
+    def test_update_frame_reuses_output_buffer(self, output):
+        """Test the same buffer is filled and sent across update_frame() calls."""
+        assert output.display_static_frame(random_frame("HD1080p25", 0), DisplayMode.HD1080p25)
+        first = sent_frame(output)
+
+        for seed in (1, 2):
+            frame = random_frame("HD1080p25", seed)
+            assert output.update_frame(frame)
+            assert sent_frame(output) is first
+            assert np.array_equal(first, rgb_float_to_yuv10(frame, matrix=output._current_matrix.value))
+
+    def test_buffer_replaced_on_format_change(self, output):
+        """Test switching pixel format allocates a new buffer and drops the old one."""
+        assert output.display_static_frame(random_frame("HD1080p25"), DisplayMode.HD1080p25)
+        yuv_buffer = sent_frame(output)
+
+        assert output.display_static_frame(random_frame("HD1080p25"), DisplayMode.HD1080p25,
+                                           pixel_format=PixelFormat.RGB10)
+        rgb_buffer = sent_frame(output)
+
+        assert rgb_buffer is not yuv_buffer
+        assert len(output._output_buffers) == 1
+
+    def test_cleanup_releases_buffer(self, output):
+        """Test cleanup() drops the cached output buffer."""
+        assert output.display_static_frame(random_frame("HD1080p25"), DisplayMode.HD1080p25)
+        assert output._output_buffers
+
+        output.cleanup()
+        assert not output._output_buffers
+
+    def test_buffer_replaced_on_size_change(self, output):
+        """Test switching display mode to a different size allocates a new buffer."""
+        assert output.display_static_frame(random_frame("HD1080p25"), DisplayMode.HD1080p25)
+        large = sent_frame(output)
+
+        assert output.display_static_frame(random_frame("HD720p50"), DisplayMode.HD720p50)
+        small = sent_frame(output)
+
+        assert small is not large
+        assert small.size < large.size
+        assert len(output._output_buffers) == 1
+
+
+@pytest.mark.skipif(not CONVERSIONS_AVAILABLE, reason="Conversion functions not available")
+class TestVideoSettingsCache:
+    """Test the per-display-mode video settings cache."""
+
+    def test_settings_queried_once_per_mode(self, output):
+        """Test repeated lookups for one mode query the device only once."""
+        for _ in range(3):
+            assert output.get_display_mode_info(DisplayMode.HD1080p25)['width'] == 12
+
+        assert output._device.get_video_settings.call_count == 1
+
+    def test_cache_cleared_by_cleanup_and_initialize(self, output):
+        """Test cleanup() and initialize() both discard cached settings."""
+        output.get_display_mode_info(DisplayMode.HD1080p25)
+        assert output._settings_cache
+
+        output.cleanup()
+        assert not output._settings_cache
+
+        assert output.initialize()
+        output._settings_cache[DisplayMode.HD1080p25.value] = "stale"
+        assert output.initialize()
+        assert not output._settings_cache
+
+        output.get_display_mode_info(DisplayMode.HD1080p25)
+        assert output._device.get_video_settings.call_count == 2
+
+    def test_uninitialized_settings_not_cached(self):
+        """Test default settings from an uninitialized device are not cached."""
+        with mock.patch.object(_decklink, "DeckLinkOutput", return_value=make_device()):
+            output = BlackmagicOutput()
+
+        output.get_display_mode_info(DisplayMode.HD1080p25)
+        assert not output._settings_cache
+
+
+@pytest.mark.skipif(not CONVERSIONS_AVAILABLE, reason="Conversion functions not available")
+class TestBgraWideInput:
+    """Test uint16 and float BGRA frames are scaled like R'G'B' for BGRA output."""
+
+    @pytest.mark.parametrize("dtype", [np.uint16, np.float32, np.float64])
+    def test_bgra_matches_rgb(self, output, dtype):
+        """Test HxWx4 input gives the same pixels as its HxWx3 R'G'B' channels."""
+        rgb = random_frame("HD1080p25").astype(dtype)
+        if dtype == np.uint16:
+            rgb = (rgb * 65535).astype(np.uint16)
+        alpha = np.zeros(rgb.shape[:2] + (1,), dtype=dtype)
+        bgra = np.concatenate([rgb[:, :, ::-1], alpha], axis=2)
+
+        assert output.display_static_frame(rgb, DisplayMode.HD1080p25, pixel_format=PixelFormat.BGRA)
+        expected = sent_frame(output).copy()
+
+        assert output.update_frame(bgra)
+        assert np.array_equal(sent_frame(output), expected)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])